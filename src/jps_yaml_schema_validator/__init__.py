@@ -19,15 +19,24 @@ file is declarative and supports:
 from __future__ import annotations
 __version__ = "1.0.3"
 
+from ._plan import CompiledSchema, compile_schema
 from .exceptions import SchemaValidationError, ValidationIssue
 from .validator import (
+    Validator,
     assert_valid_config,
+    iter_issues,
+    validate_batch,
     validate_config_against_schema,
 )
 
 __all__ = [
+    "CompiledSchema",
     "SchemaValidationError",
     "ValidationIssue",
+    "Validator",
+    "compile_schema",
     "validate_config_against_schema",
+    "validate_batch",
+    "iter_issues",
     "assert_valid_config",
 ]
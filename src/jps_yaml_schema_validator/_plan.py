@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+_plan.py
+
+Schema compilation for jps_yaml_schema_validator.
+
+:func:`compile_schema` walks a parsed schema mapping once and turns each
+rule dictionary into a plan object. The validator reads plain attributes
+from these plans instead of re-parsing the rule mappings on every call,
+so a schema validated against many configurations only pays the parsing
+cost once.
+
+Plans are plain slotted dataclasses rather than frozen ones: one-shot
+validation compiles the schema on every call, and frozen dataclass
+construction costs several times more. Plans are never modified after
+:func:`compile_schema` returns.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import re
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Pattern, Tuple
+
+
+class FieldType(IntEnum):
+    """Resolved field type of a compiled rule."""
+
+    STRING = 0
+    INT = 1
+    FLOAT = 2
+    BOOL = 3
+    ENUM = 4
+    FILE = 5
+    DIRECTORY = 6
+    LIST = 7
+    UNSUPPORTED = 8
+
+
+_TYPE_IDS: Dict[str, FieldType] = {
+    "string": FieldType.STRING,
+    "int": FieldType.INT,
+    "float": FieldType.FLOAT,
+    "bool": FieldType.BOOL,
+    "enum": FieldType.ENUM,
+    "file": FieldType.FILE,
+    "dir": FieldType.DIRECTORY,
+    "directory": FieldType.DIRECTORY,
+    "list": FieldType.LIST,
+}
+
+
+@dataclass(slots=True)
+class _FieldPlan:
+    """Compiled rule for a single field.
+
+    Attributes:
+        required: Whether the field must be present and non-null.
+        type_id: Resolved field type.
+        type_name: Declared type string, as written in the schema.
+        rule: Copy of the rule mapping, shared by every issue reported
+            for this field. Read-only by contract: it is never mutated
+            after compilation and callers must not modify it.
+        needs_deep_check: False if the rule only constrains the value's
+            type, in which case validation stops at the type check. Such
+            rules compile to a bare :class:`_FieldPlan` rather than the
+            type's plan subclass, since no other attribute is read.
+    """
+
+    required: bool
+    type_id: FieldType
+    type_name: str
+    rule: Mapping[str, Any]
+    needs_deep_check: bool = True
+
+
+@dataclass(slots=True)
+class _StringPlan(_FieldPlan):
+    """Compiled ``string`` rule.
+
+    Attributes:
+        min_length: Minimum string length, if constrained.
+        max_length: Maximum string length, if constrained.
+        pattern: Regex pattern string, as written in the schema.
+        regex: Compiled ``pattern``, or None if absent or invalid.
+        regex_error: Compilation error message for an invalid ``pattern``.
+    """
+
+    min_length: Optional[int] = None
+    max_length: Optional[int] = None
+    pattern: Optional[str] = None
+    regex: Optional[Pattern[str]] = None
+    regex_error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class _IntPlan(_FieldPlan):
+    """Compiled ``int`` rule.
+
+    Attributes:
+        min: Inclusive lower bound, if constrained.
+        max: Inclusive upper bound, if constrained.
+        lo: ``min``, or negative infinity if unconstrained.
+        hi: ``max``, or positive infinity if unconstrained.
+    """
+
+    min: Any = None
+    max: Any = None
+    lo: Any = -math.inf
+    hi: Any = math.inf
+
+
+@dataclass(slots=True)
+class _FloatPlan(_FieldPlan):
+    """Compiled ``float`` rule.
+
+    Attributes:
+        min: Inclusive lower bound coerced to float, if constrained.
+        max: Inclusive upper bound coerced to float, if constrained.
+        lo: ``min``, or negative infinity if unconstrained.
+        hi: ``max``, or positive infinity if unconstrained.
+        invalid_bounds: Whether ``min`` or ``max`` is not a number; the
+            bounds are then left unset.
+        min_as_written: ``min`` as written in the schema, quoted in
+            issue messages.
+        max_as_written: ``max`` as written in the schema, quoted in
+            issue messages.
+    """
+
+    min: Optional[float] = None
+    max: Optional[float] = None
+    lo: float = -math.inf
+    hi: float = math.inf
+    invalid_bounds: bool = False
+    min_as_written: Any = None
+    max_as_written: Any = None
+
+
+@dataclass(slots=True)
+class _EnumPlan(_FieldPlan):
+    """Compiled ``enum`` rule.
+
+    Attributes:
+        allowed: Allowed values in schema order, or None if the schema's
+            ``allowed`` entry is not a list/sequence.
+        allowed_set: ``allowed`` as a frozenset for constant-time
+            membership, or None if any allowed value is unhashable.
+    """
+
+    allowed: Optional[Tuple[Any, ...]] = None
+    allowed_set: Optional[FrozenSet[Any]] = None
+
+
+@dataclass(slots=True)
+class _FilePlan(_FieldPlan):
+    """Compiled ``file`` rule.
+
+    Attributes:
+        must_be_absolute: Whether the path must be absolute.
+        must_exist: Whether the file must exist.
+        must_be_readable: Whether the file must be readable.
+        non_empty: Whether the file must be non-empty.
+        extensions: Allowed filename suffixes, ready to pass to
+            ``str.endswith``; empty if unconstrained.
+        invalid_extensions: Whether the schema's ``extensions`` entry is
+            not iterable; ``extensions`` is then left empty.
+    """
+
+    must_be_absolute: bool = False
+    must_exist: bool = False
+    must_be_readable: bool = False
+    non_empty: bool = False
+    extensions: Tuple[str, ...] = ()
+    invalid_extensions: bool = False
+
+
+@dataclass(slots=True)
+class _DirectoryPlan(_FieldPlan):
+    """Compiled ``dir``/``directory`` rule.
+
+    Attributes:
+        must_be_absolute: Whether the path must be absolute.
+        must_exist: Whether the directory must exist.
+    """
+
+    must_be_absolute: bool = False
+    must_exist: bool = False
+
+
+@dataclass(slots=True)
+class _ListPlan(_FieldPlan):
+    """Compiled ``list`` rule.
+
+    Attributes:
+        min_items: Minimum number of items, if constrained.
+        max_items: Maximum number of items, if constrained.
+        element: Compiled rule applied to each item, if ``element_type``
+            is set.
+    """
+
+    min_items: Optional[int] = None
+    max_items: Optional[int] = None
+    # Derived from ``rule`` (which already includes the element
+    # constraints), so it is left out of ``==``; a list-of-lists plan is
+    # its own element and comparing it would recurse forever.
+    element: Optional[_FieldPlan] = field(default=None, compare=False)
+
+
+@dataclass(frozen=True)
+class CompiledSchema:
+    """Schema compiled by :func:`compile_schema`.
+
+    Attributes:
+        public_fields: ``(field_name, plan)`` pairs for every validated
+            field, in schema order. Reserved / meta keys are not
+            included.
+        schema_keys: Every key defined in the schema, including meta
+            keys, used to detect unexpected configuration keys.
+    """
+
+    public_fields: Tuple[Tuple[str, _FieldPlan], ...]
+    schema_keys: FrozenSet[Any]
+
+
+def compile_schema(schema: Mapping[str, Any]) -> CompiledSchema:
+    """Compile a schema mapping into field plans.
+
+    Reserved / meta keys (convention: leading underscores) are skipped.
+
+    Args:
+        schema: Mapping representing the validation schema (rules).
+
+    Returns:
+        The compiled schema.
+    """
+    fields: List[Tuple[str, _FieldPlan]] = []
+    for field_name, rule in schema.items():
+        if isinstance(field_name, str) and field_name.startswith("_"):
+            continue
+        fields.append((field_name, _compile_rule(rule or {})))
+    return CompiledSchema(public_fields=tuple(fields), schema_keys=frozenset(schema))
+
+
+# Fields shared by every plan, passed positionally to the plan classes:
+# ``(required, type_id, type_name, rule)``.
+_Head = Tuple[bool, FieldType, str, Dict[str, Any]]
+
+
+def _compile_rule(rule: Mapping[str, Any]) -> _FieldPlan:
+    """Compile a single rule mapping into its typed plan."""
+    type_name = str(rule.get("type", "string"))
+    type_id = _TYPE_IDS.get(type_name, FieldType.UNSUPPORTED)
+    head: _Head = (bool(rule.get("required", False)), type_id, type_name, dict(rule))
+    compile_typed = _COMPILERS.get(type_id)
+    if compile_typed is None:
+        return _FieldPlan(*head)
+    return compile_typed(head, rule)
+
+
+def _compile_type_only(head: _Head, rule: Mapping[str, Any]) -> _FieldPlan:
+    """Compile a rule that has no constraints beyond the value's type."""
+    return _FieldPlan(*head, False)
+
+
+def _compile_int(head: _Head, rule: Mapping[str, Any]) -> _FieldPlan:
+    """Compile an ``int`` rule and its comparison bounds."""
+    min_value = rule.get("min")
+    max_value = rule.get("max")
+    if min_value is None and max_value is None:
+        return _FieldPlan(*head, False)
+    return _IntPlan(*head, True, min_value, max_value, *_range(min_value, max_value))
+
+
+def _compile_float(head: _Head, rule: Mapping[str, Any]) -> _FieldPlan:
+    """Compile a ``float`` rule, coercing its bounds to float."""
+    # A bound that is not a number is kept out of the plan and reported as
+    # a schema error when the field is validated, so configurations that
+    # omit the field still validate.
+    min_as_written = rule.get("min")
+    max_as_written = rule.get("max")
+    try:
+        min_value = _as_float(min_as_written)
+        max_value = _as_float(max_as_written)
+    except (TypeError, ValueError):
+        return _FloatPlan(*head, invalid_bounds=True)
+    if min_value is None and max_value is None:
+        return _FieldPlan(*head, False)
+    return _FloatPlan(
+        *head,
+        True,
+        min_value,
+        max_value,
+        *_range(min_value, max_value),
+        min_as_written=min_as_written,
+        max_as_written=max_as_written,
+    )
+
+
+def _compile_file(head: _Head, rule: Mapping[str, Any]) -> _FilePlan:
+    """Compile a ``file`` rule."""
+    extensions = rule.get("extensions") or ()
+    # A non-iterable entry is reported when the field is validated.
+    invalid_extensions = not isinstance(extensions, Iterable)
+    return _FilePlan(
+        *head,
+        must_be_absolute=bool(rule.get("must_be_absolute", False)),
+        must_exist=bool(rule.get("must_exist", False)),
+        must_be_readable=bool(rule.get("must_be_readable", False)),
+        non_empty=bool(rule.get("non_empty", False)),
+        extensions=() if invalid_extensions else tuple(map(str, extensions)),
+        invalid_extensions=invalid_extensions,
+    )
+
+
+def _compile_directory(head: _Head, rule: Mapping[str, Any]) -> _DirectoryPlan:
+    """Compile a ``dir``/``directory`` rule."""
+    return _DirectoryPlan(
+        *head,
+        must_be_absolute=bool(rule.get("must_be_absolute", False)),
+        must_exist=bool(rule.get("must_exist", False)),
+    )
+
+
+def _compile_string(head: _Head, rule: Mapping[str, Any]) -> _FieldPlan:
+    """Compile a ``string`` rule, precompiling its regex if present."""
+    min_length = rule.get("min_length")
+    max_length = rule.get("max_length")
+    pattern = rule.get("regex")
+    if min_length is None and max_length is None and not pattern:
+        return _FieldPlan(*head, False)
+
+    regex: Optional[Pattern[str]] = None
+    regex_error: Optional[str] = None
+    if pattern:
+        pattern = str(pattern)
+        regex, regex_error = _compile_pattern(pattern)
+    else:
+        pattern = None
+
+    min_length = min_length if isinstance(min_length, int) else None
+    max_length = max_length if isinstance(max_length, int) else None
+    return _StringPlan(
+        *head,
+        min_length is not None or max_length is not None or pattern is not None,
+        min_length,
+        max_length,
+        pattern,
+        regex,
+        regex_error,
+    )
+
+
+def _compile_enum(head: _Head, rule: Mapping[str, Any]) -> _EnumPlan:
+    """Compile an ``enum`` rule into a tuple and, if possible, a frozenset."""
+    allowed = rule.get("allowed")
+    # Exact list/tuple checks skip the slower ABC isinstance check for the
+    # usual YAML lists.
+    if type(allowed) is not list and type(allowed) is not tuple:
+        if not isinstance(allowed, Iterable) or isinstance(allowed, (str, bytes)):
+            return _EnumPlan(*head)
+    allowed = tuple(allowed)
+    try:
+        allowed_set: Optional[FrozenSet[Any]] = frozenset(allowed)
+    except TypeError:
+        allowed_set = None
+    return _EnumPlan(*head, True, allowed, allowed_set)
+
+
+def _compile_list(head: _Head, rule: Mapping[str, Any]) -> _ListPlan:
+    """Compile a ``list`` rule together with its per-element rule."""
+    min_items = rule.get("min_items")
+    max_items = rule.get("max_items")
+    min_items = min_items if isinstance(min_items, int) else None
+    max_items = max_items if isinstance(max_items, int) else None
+    element = _compile_element(head, rule)
+    return _ListPlan(
+        *head,
+        min_items is not None or max_items is not None or element is not None,
+        min_items,
+        max_items,
+        element,
+    )
+
+
+def _compile_element(head: _Head, rule: Mapping[str, Any]) -> Optional[_FieldPlan]:
+    """Compile the rule applied to each item of a list, if any."""
+    element_type = rule.get("element_type")
+    if not element_type:
+        return None
+
+    element_rule: Dict[str, Any] = dict(rule)
+    element_rule["type"] = element_type
+    # List-level constraints do not apply per element.
+    element_rule.pop("min_items", None)
+    element_rule.pop("max_items", None)
+
+    if _TYPE_IDS.get(str(element_type)) != FieldType.LIST:
+        return _compile_rule(element_rule)
+
+    # A list of lists keeps ``element_type: list`` at every level, so the
+    # element plan is its own element.
+    required, type_id, type_name, _ = head
+    element = _ListPlan(required, type_id, type_name, element_rule)
+    element.element = element
+    return element
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_pattern(pattern: str) -> Tuple[Optional[Pattern[str]], Optional[str]]:
+    """Compile a regex pattern into a ``(regex, error)`` pair, one of them None."""
+    # ``re`` keeps its own cache, but it is shared with every other caller
+    # in the process and is flushed wholesale when full; this cache only
+    # holds schema patterns.
+    try:
+        return re.compile(pattern), None
+    except re.error as exc:
+        return None, str(exc)
+
+
+def _range(min_value: Any, max_value: Any) -> Tuple[Any, Any]:
+    """Build the ``(lo, hi)`` comparison bounds of a numeric plan."""
+    return (
+        -math.inf if min_value is None else min_value,
+        math.inf if max_value is None else max_value,
+    )
+
+
+def _as_float(value: Any) -> Optional[float]:
+    """Coerce a numeric bound to float, preserving None."""
+    return None if value is None else float(value)
+
+
+# Per-type compile functions; unsupported types compile to a bare
+# _FieldPlan that reports the type at validation time.
+_COMPILERS: Dict[FieldType, Callable[[_Head, Mapping[str, Any]], _FieldPlan]] = {
+    FieldType.STRING: _compile_string,
+    FieldType.INT: _compile_int,
+    FieldType.FLOAT: _compile_float,
+    FieldType.BOOL: _compile_type_only,
+    FieldType.ENUM: _compile_enum,
+    FieldType.FILE: _compile_file,
+    FieldType.DIRECTORY: _compile_directory,
+    FieldType.LIST: _compile_list,
+}
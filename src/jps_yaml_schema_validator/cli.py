@@ -13,14 +13,20 @@ Typical usage:
 from __future__ import annotations
 
 import sys
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
 import typer
 import yaml
 
-from .exceptions import SchemaValidationError
-from .validator import assert_valid_config
+from .validator import iter_issues
+
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
 
 app = typer.Typer(add_completion=False, help="YAML schema-based configuration validator.")
 
@@ -49,35 +55,54 @@ def validate(
         True,
         "--allow-extra-keys/--no-allow-extra-keys",
         help="Allow configuration keys not defined in the schema.",
-    )
+    ),
+    max_issues: Optional[int] = typer.Option(
+        None,
+        "--max-issues",
+        min=1,
+        help="Stop after reporting this many issues (default: report all).",
+    ),
 ) -> None:
     """Validate a configuration file against a schema."""
     try:
-        with schema.open("r", encoding="utf-8") as fh:
-            schema_data = yaml.safe_load(fh) or {}
-
-        with config.open("r", encoding="utf-8") as fh:
-            config_data = yaml.safe_load(fh) or {}
-
-        assert_valid_config(
-            schema=schema_data,
-            config=config_data,
-            allow_extra_keys=allow_extra_keys,
+        # Files are read as bytes; the loader detects the encoding itself.
+        # _Loader is a safe loader, so bandit's B506 does not apply.
+        with schema.open("rb") as fh:
+            schema_data = yaml.load(fh, Loader=_Loader) or {}  # nosec B506
+
+        with config.open("rb") as fh:
+            config_data = yaml.load(fh, Loader=_Loader) or {}  # nosec B506
+
+        # Issues are produced lazily, so validation stops once
+        # ``max_issues`` have been collected; one extra issue is taken to
+        # tell whether the report was cut short.
+        limit = None if max_issues is None else max_issues + 1
+        issues = list(
+            islice(
+                iter_issues(schema_data, config_data, allow_extra_keys=allow_extra_keys),
+                limit,
+            )
         )
-    except SchemaValidationError as exc:
-        typer.echo("❌ Validation failed:", err=True)
-        for issue in exc.issues:
-            typer.echo(f"  - {issue}", err=True)
-        raise typer.Exit(code=1) from exc
-    
     except yaml.YAMLError as exc:
         typer.echo(f"❌ Invalid YAML: {exc}", err=True)
         raise typer.Exit(code=2) from exc
-    
+
     except Exception as exc:  # pragma: no cover - defensive
         typer.echo(f"Unexpected error: {exc}", err=True)
         raise typer.Exit(code=2) from exc
 
+    if issues:
+        truncated = max_issues is not None and len(issues) > max_issues
+        typer.echo("❌ Validation failed:", err=True)
+        for issue in issues[:max_issues]:
+            typer.echo(f"  - {issue}", err=True)
+        if truncated:
+            typer.echo(
+                f"  (stopped after {max_issues} issues; more remain)",
+                err=True,
+            )
+        raise typer.Exit(code=1)
+
     typer.echo("✅ Configuration is valid.")
 
 
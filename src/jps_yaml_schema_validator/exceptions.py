@@ -9,24 +9,27 @@ Exception and error types for jps_yaml_schema_validator.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Iterable, List, Optional
+from typing import Any, Iterable, List, Mapping, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationIssue:
     """Represents a single validation issue.
 
     Attributes:
         field: Name of the configuration field associated with this issue.
         message: Human-readable description of the validation problem.
-        rule: Optional rule dictionary that was applied when the
+        rule: Optional rule mapping that was applied when the
             validation issue occurred. This is primarily intended for
-            debugging and advanced reporting.
+            debugging and advanced reporting. The mapping is shared by
+            all issues reported for the same field and must be treated
+            as read-only; copy it with ``dict(issue.rule)`` before
+            modifying.
     """
 
     field: str
     message: str
-    rule: Optional[dict[str, Any]] = None
+    rule: Optional[Mapping[str, Any]] = None
 
     def __str__(self) -> str:
         return f"{self.field}: {self.message}"
@@ -47,3 +50,8 @@ class SchemaValidationError(Exception):
         self.issues: List[ValidationIssue] = list(issues)
         message = "\n".join(str(issue) for issue in self.issues)
         super().__init__(message)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Rebuild from the issues; the default would pass the joined message
+        # string back to ``__init__`` as the issue iterable.
+        return type(self), (self.issues,)
@@ -31,25 +31,188 @@ dictionary. Example:
 
 from __future__ import annotations
 
+import errno
+import functools
 import os
-import re
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, Optional
-
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from ._plan import (
+    CompiledSchema,
+    FieldType,
+    _DirectoryPlan,
+    _EnumPlan,
+    _FieldPlan,
+    _FilePlan,
+    _FloatPlan,
+    _IntPlan,
+    _ListPlan,
+    _StringPlan,
+    _as_float,
+    _compile_pattern,
+    _compile_rule,
+    compile_schema,
+)
 from .exceptions import SchemaValidationError, ValidationIssue
 
+# Fixed issue messages.
+_MSG_UNEXPECTED_KEY = "Unexpected configuration key (not defined in schema)."
+_MSG_MISSING = "Missing required field."
+_MSG_NULL = "Required field is null."
+_MSG_ENUM_ALLOWED_NOT_LIST = "Schema error: 'allowed' must be a list/sequence for enum type."
+_MSG_FILE_EXTENSIONS_NOT_LIST = "Schema error: 'extensions' must be a list/sequence for file type."
+_MSG_FLOAT_BOUNDS_NOT_NUMBERS = "Schema error: 'min'/'max' must be numbers for float type."
+_MSG_FILE_NOT_ABSOLUTE = "File path must be absolute."
+_MSG_DIR_NOT_ABSOLUTE = "Directory path must be absolute."
+
 
-@dataclass
+@dataclass(slots=True)
 class _Context:
-    """Internal validation context.
+    """Internal validation context, created once per validation call.
 
     Attributes:
         allow_extra_keys: If False, keys present in the configuration
             but not defined in the schema will be reported as issues.
+        stat_cache: ``os.stat`` outcome per file path, so paths repeated
+            within one configuration (e.g. in a list of files) are only
+            stat'ed once. Values are a ``(stat_result, stat_failed)``
+            pair; ``stat_result`` is None if the path does not exist.
+        readable_cache: ``os.access(path, os.R_OK)`` result per path.
     """
 
     allow_extra_keys: bool = True
+    stat_cache: Dict[str, Tuple[Optional[os.stat_result], bool]] = field(default_factory=dict)
+    readable_cache: Dict[str, bool] = field(default_factory=dict)
+
+
+# Lists of at least this many files have their filesystem checks run
+# concurrently, using up to this many threads.
+_PARALLEL_FILE_CHECK_MIN_ITEMS = 32
+_PARALLEL_FILE_CHECK_WORKERS = 16
+
+# Path separators stripped from the end of a path by ``pathlib.Path``.
+_PATH_SEPARATORS = os.sep + (os.altsep or "")
+
+# ``os.stat`` errors reported as "does not exist", as ``Path.exists()``
+# does; any other error is reported as a failure to stat the file.
+_MISSING_PATH_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP})
+
+_Handler = Callable[[str, Any, Any, _Context], Iterator[ValidationIssue]]
+
+
+class Validator:
+    """Validator bound to a schema that is compiled once.
+
+    Use this instead of :func:`validate_config_against_schema` when the
+    same schema is applied to many configurations; the schema is parsed
+    into field plans on construction and reused by every
+    :meth:`validate` call. A schema already compiled with
+    :func:`compile_schema` is used as-is, so several validators can share
+    one compilation.
+
+    Example:
+        >>> validator = Validator({"name": {"type": "string", "required": True}})
+        >>> validator.validate({"name": "hello"})
+        []
+    """
+
+    def __init__(self, schema: Union[Mapping[str, Any], CompiledSchema]) -> None:
+        if isinstance(schema, CompiledSchema):
+            self._compiled: CompiledSchema = schema
+        else:
+            self._compiled = compile_schema(schema)
+
+    def iter_issues(
+        self,
+        config: Mapping[str, Any],
+        *,
+        allow_extra_keys: bool = True,
+    ) -> Iterator[ValidationIssue]:
+        """Lazily yield validation issues for a configuration mapping.
+
+        Issues are produced in the same order as :meth:`validate` returns
+        them; callers that stop consuming early (e.g. to report only the
+        first few issues) skip validating the remaining fields.
+
+        Args:
+            config: Mapping representing the user configuration to be
+                validated.
+            allow_extra_keys: If False, keys present in ``config`` but not
+                in the schema will be reported as issues.
+
+        Yields:
+            :class:`ValidationIssue` objects, one per detected problem.
+        """
+        ctx = _Context(allow_extra_keys=allow_extra_keys)
+
+        # 1. Validate each field defined in the schema.
+        compiled = self._compiled
+        for field_name, plan in compiled.public_fields:
+            yield from _validate_field(field_name, plan, config, ctx)
+
+        # 2. Optionally validate extra keys in config.
+        if not ctx.allow_extra_keys:
+            schema_keys = compiled.schema_keys
+            for field_name in config.keys():
+                if field_name not in schema_keys:
+                    yield ValidationIssue(
+                        field=field_name,
+                        message=_MSG_UNEXPECTED_KEY,
+                        rule=None,
+                    )
+
+    def validate(
+        self,
+        config: Mapping[str, Any],
+        *,
+        allow_extra_keys: bool = True,
+    ) -> List[ValidationIssue]:
+        """Validate a configuration mapping against the compiled schema.
+
+        Args:
+            config: Mapping representing the user configuration to be
+                validated.
+            allow_extra_keys: If False, keys present in ``config`` but not
+                in the schema will be reported as issues.
+
+        Returns:
+            List of :class:`ValidationIssue` objects describing all
+            detected validation problems.
+        """
+        return list(self.iter_issues(config, allow_extra_keys=allow_extra_keys))
+
+    def validate_batch(
+        self,
+        configs: Iterable[Mapping[str, Any]],
+        *,
+        allow_extra_keys: bool = True,
+    ) -> List[List[ValidationIssue]]:
+        """Validate several configuration mappings against the compiled schema.
+
+        Args:
+            configs: Configuration mappings to validate.
+            allow_extra_keys: If False, keys present in a configuration but
+                not in the schema will be reported as issues.
+
+        Returns:
+            One list of :class:`ValidationIssue` objects per configuration,
+            in input order.
+        """
+        return [self.validate(config, allow_extra_keys=allow_extra_keys) for config in configs]
 
 
 def validate_config_against_schema(
@@ -64,6 +227,10 @@ def validate_config_against_schema(
     :class:`ValidationIssue` instances. Use
     :func:`assert_valid_config` to raise if any issues are present.
 
+    The schema is read directly rather than compiled; use
+    :class:`Validator` to compile it once when validating many
+    configurations.
+
     Args:
         schema: Mapping representing the validation schema (rules). The
             typical source is a YAML rules file.
@@ -76,36 +243,55 @@ def validate_config_against_schema(
         List of :class:`ValidationIssue` objects describing all detected
         validation problems.
     """
-    issues: List[ValidationIssue] = []
-    ctx = _Context(allow_extra_keys=allow_extra_keys)
+    return list(_iter_issues_uncompiled(schema, config, allow_extra_keys))
 
-    # 1. Validate each field defined in the schema.
-    for field_name, rule in schema.items():
-        # Skip reserved / meta keys (convention: leading underscores).
-        if isinstance(field_name, str) and field_name.startswith("_"):
-            continue
 
-        _validate_field(
-            field_name=field_name,
-            rule=rule or {},
-            config=config,
-            ctx=ctx,
-            issues=issues,
-        )
+def iter_issues(
+    schema: Mapping[str, Any],
+    config: Mapping[str, Any],
+    *,
+    allow_extra_keys: bool = True,
+) -> Iterator[ValidationIssue]:
+    """Lazily yield the issues :func:`validate_config_against_schema` would return.
 
-    # 2. Optionally validate extra keys in config.
-    if not ctx.allow_extra_keys:
-        for field_name in config.keys():
-            if field_name not in schema:
-                issues.append(
-                    ValidationIssue(
-                        field=field_name,
-                        message="Unexpected configuration key (not defined in schema).",
-                        rule=None,
-                    )
-                )
+    Useful when only the first few issues are needed, e.g.
+    ``itertools.islice(iter_issues(schema, config), 10)``; fields after
+    the last consumed issue are never validated.
 
-    return issues
+    Args:
+        schema: Mapping representing the validation schema (rules).
+        config: Mapping representing the user configuration to be
+            validated.
+        allow_extra_keys: If False, keys present in ``config`` but not
+            in ``schema`` will be reported as issues.
+
+    Returns:
+        Iterator over :class:`ValidationIssue` objects.
+    """
+    return _iter_issues_uncompiled(schema, config, allow_extra_keys)
+
+
+def validate_batch(
+    schema: Mapping[str, Any],
+    configs: Iterable[Mapping[str, Any]],
+    *,
+    allow_extra_keys: bool = True,
+) -> List[List[ValidationIssue]]:
+    """Validate many configuration mappings against one schema.
+
+    The schema is compiled once and reused for every configuration.
+
+    Args:
+        schema: Mapping representing the validation schema (rules).
+        configs: Configuration mappings to validate.
+        allow_extra_keys: If False, keys present in a configuration but not
+            in ``schema`` will be reported as issues.
+
+    Returns:
+        One list of :class:`ValidationIssue` objects per configuration, in
+        input order.
+    """
+    return Validator(schema).validate_batch(configs, allow_extra_keys=allow_extra_keys)
 
 
 def assert_valid_config(
@@ -113,6 +299,7 @@ def assert_valid_config(
     config: Mapping[str, Any],
     *,
     allow_extra_keys: bool = True,
+    fail_fast: bool = False,
 ) -> None:
     """Validate configuration and raise if any issues are found.
 
@@ -121,17 +308,23 @@ def assert_valid_config(
         config: Parsed configuration mapping.
         allow_extra_keys: Whether to allow keys in ``config`` that are
             not defined in the schema.
+        fail_fast: If True, stop at the first issue and raise with only
+            that issue; remaining fields are not validated. Useful when
+            only a pass/fail answer is needed.
 
     Raises:
         SchemaValidationError: If any validation issues are detected.
     """
-    issues = validate_config_against_schema(
-        schema=schema,
-        config=config,
-        allow_extra_keys=allow_extra_keys,
-    )
-    if issues:
-        raise SchemaValidationError(issues)
+    issues = iter_issues(schema, config, allow_extra_keys=allow_extra_keys)
+    if fail_fast:
+        first = next(issues, None)
+        if first is not None:
+            raise SchemaValidationError([first])
+        return
+
+    collected = list(issues)
+    if collected:
+        raise SchemaValidationError(collected)
 
 
 # --------------------------------------------------------------------------- #
@@ -141,419 +334,680 @@ def assert_valid_config(
 
 def _validate_field(
     field_name: str,
-    rule: Mapping[str, Any],
+    plan: _FieldPlan,
     config: Mapping[str, Any],
     ctx: _Context,
-    issues: List[ValidationIssue],
-) -> None:
-    """Validate a single field according to its rule."""
-    required = bool(rule.get("required", False))
-
+) -> Iterable[ValidationIssue]:
+    """Validate a single field according to its compiled rule."""
+    # Like ``_validate_value``, returns the issues lazily without adding a
+    # generator layer of its own.
     if field_name not in config:
-        if required:
-            issues.append(
+        if plan.required:
+            return (
                 ValidationIssue(
                     field=field_name,
-                    message="Missing required field.",
-                    rule=dict(rule),
-                )
+                    message=_MSG_MISSING,
+                    rule=plan.rule,
+                ),
             )
         # If not required and not present, nothing more to validate.
-        return
+        return ()
+
+    return _validate_value(field_name, config.get(field_name), plan, ctx)
 
-    value = config.get(field_name)
-    field_type = str(rule.get("type", "string"))
 
+def _validate_value(
+    field_name: str,
+    value: Any,
+    plan: _FieldPlan,
+    ctx: _Context,
+) -> Iterable[ValidationIssue]:
+    """Validate a present value (top-level field or list item)."""
+    # Returns the type handler's generator itself, or a tuple for issues
+    # known up front, so each value costs a single generator.
     if value is None:
-        if required:
-            issues.append(
+        if plan.required:
+            return (
                 ValidationIssue(
                     field=field_name,
-                    message="Required field is null.",
-                    rule=dict(rule),
-                )
+                    message=_MSG_NULL,
+                    rule=plan.rule,
+                ),
             )
-        return
+        return ()
 
-    # Dispatch based on declared type.
-    if field_type == "string":
-        _validate_string(field_name, value, rule, issues)
-    elif field_type == "int":
-        _validate_int(field_name, value, rule, issues)
-    elif field_type == "float":
-        _validate_float(field_name, value, rule, issues)
-    elif field_type == "bool":
-        _validate_bool(field_name, value, rule, issues)
-    elif field_type == "enum":
-        _validate_enum(field_name, value, rule, issues)
-    elif field_type == "file":
-        _validate_file(field_name, value, rule, issues)
-    elif field_type in {"dir", "directory"}:
-        _validate_directory(field_name, value, rule, issues)
-    elif field_type == "list":
-        _validate_list(field_name, value, rule, issues)
+    # Dispatch based on declared type; rules without value constraints
+    # only need the type check.
+    if plan.needs_deep_check:
+        handler = _DISPATCH.get(plan.type_id)
     else:
-        issues.append(
+        handler = _TYPE_ONLY_DISPATCH.get(plan.type_id)
+    if handler is None:
+        return (
             ValidationIssue(
                 field=field_name,
-                message=f"Unsupported type in schema: {field_type!r}.",
-                rule=dict(rule),
-            )
+                message=f"Unsupported type in schema: {plan.type_name!r}.",
+                rule=plan.rule,
+            ),
         )
+    return handler(field_name, value, plan, ctx)
+
+
+@functools.lru_cache(maxsize=256)
+def _type_mismatch(expected: str, actual: str) -> str:
+    """Build (and reuse) the message for a value of type ``actual`` (a type name)."""
+    # The same message repeats for every bad item of a list, so it is only
+    # formatted once per (expected, actual) pair. Keyed on the type name
+    # rather than the type, so the cache holds no references to classes.
+    return f"Expected {expected}, got {actual}."
+
+
+def _is_int(value: Any) -> bool:
+    """Return whether ``value`` is an int; bools are rejected."""
+    # The identity check covers plain ints without walking the MRO.
+    return type(value) is int or (isinstance(value, int) and not isinstance(value, bool))
+
+
+def _is_number(value: Any) -> bool:
+    """Return whether ``value`` is an int or a float; bools are rejected."""
+    value_type = type(value)
+    if value_type is float or value_type is int:
+        return True
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_str(value: Any) -> bool:
+    """Return whether ``value`` is a string."""
+    return isinstance(value, str)
+
+
+def _is_list(value: Any) -> bool:
+    """Return whether ``value`` is a list."""
+    return isinstance(value, list)
+
+
+def _type_only(expected: str, predicate: Callable[[Any], bool]) -> _Handler:
+    """Build a validator that only checks the value's type."""
+
+    def validate(
+        field_name: str,
+        value: Any,
+        plan: _FieldPlan,
+        ctx: _Context,
+    ) -> Iterator[ValidationIssue]:
+        if not predicate(value):
+            yield ValidationIssue(
+                field=field_name,
+                message=_type_mismatch(expected, type(value).__name__),
+                rule=plan.rule,
+            )
+
+    return validate
 
 
 def _validate_string(
     field_name: str,
     value: Any,
-    rule: Mapping[str, Any],
-    issues: List[ValidationIssue],
-) -> None:
+    plan: _StringPlan,
+    ctx: _Context,
+) -> Iterator[ValidationIssue]:
     if not isinstance(value, str):
-        issues.append(
-            ValidationIssue(
-                field=field_name,
-                message=f"Expected string, got {type(value).__name__}.",
-                rule=dict(rule),
-            )
+        yield ValidationIssue(
+            field=field_name,
+            message=_type_mismatch("string", type(value).__name__),
+            rule=plan.rule,
         )
         return
 
-    min_length = rule.get("min_length")
-    max_length = rule.get("max_length")
-    pattern = rule.get("regex")
+    min_length = plan.min_length
+    max_length = plan.max_length
 
-    if isinstance(min_length, int) and len(value) < min_length:
-        issues.append(
-            ValidationIssue(
-                field=field_name,
-                message=f"String shorter than minimum length {min_length}.",
-                rule=dict(rule),
-            )
+    if min_length is not None and len(value) < min_length:
+        yield ValidationIssue(
+            field=field_name,
+            message=f"String shorter than minimum length {min_length}.",
+            rule=plan.rule,
         )
 
-    if isinstance(max_length, int) and len(value) > max_length:
-        issues.append(
-            ValidationIssue(
-                field=field_name,
-                message=f"String longer than maximum length {max_length}.",
-                rule=dict(rule),
-            )
+    if max_length is not None and len(value) > max_length:
+        yield ValidationIssue(
+            field=field_name,
+            message=f"String longer than maximum length {max_length}.",
+            rule=plan.rule,
         )
 
-    if pattern:
-        try:
-            regex = re.compile(str(pattern))
-        except re.error as exc:
-            issues.append(
-                ValidationIssue(
-                    field=field_name,
-                    message=f"Invalid regex in schema: {exc}.",
-                    rule=dict(rule),
-                )
-            )
-            return
+    if plan.regex_error is not None:
+        yield ValidationIssue(
+            field=field_name,
+            message=f"Invalid regex in schema: {plan.regex_error}.",
+            rule=plan.rule,
+        )
+        return
 
-        if regex.fullmatch(value) is None:
-            issues.append(
-                ValidationIssue(
-                    field=field_name,
-                    message=f"Value does not match regex pattern {pattern!r}.",
-                    rule=dict(rule),
-                )
-            )
+    if plan.regex is not None and plan.regex.fullmatch(value) is None:
+        yield ValidationIssue(
+            field=field_name,
+            message=f"Value does not match regex pattern {plan.pattern!r}.",
+            rule=plan.rule,
+        )
 
 
 def _validate_int(
     field_name: str,
     value: Any,
-    rule: Mapping[str, Any],
-    issues: List[ValidationIssue],
-) -> None:
-    if not isinstance(value, int):
-        issues.append(
-            ValidationIssue(
-                field=field_name,
-                message=f"Expected int, got {type(value).__name__}.",
-                rule=dict(rule),
-            )
+    plan: _IntPlan,
+    ctx: _Context,
+) -> Iterator[ValidationIssue]:
+    if not _is_int(value):
+        yield ValidationIssue(
+            field=field_name,
+            message=_type_mismatch("int", type(value).__name__),
+            rule=plan.rule,
         )
         return
 
-    min_value = rule.get("min")
-    max_value = rule.get("max")
+    # In-range values take a single chained comparison; absent bounds
+    # are infinite, so no None checks are needed.
+    if plan.lo <= value <= plan.hi:
+        return
+
+    min_value = plan.min
+    max_value = plan.max
 
     if min_value is not None and value < min_value:
-        issues.append(
-            ValidationIssue(
-                field=field_name,
-                message=f"Value {value} is less than minimum {min_value}.",
-                rule=dict(rule),
-            )
+        yield ValidationIssue(
+            field=field_name,
+            message=f"Value {value} is less than minimum {min_value}.",
+            rule=plan.rule,
         )
     if max_value is not None and value > max_value:
-        issues.append(
-            ValidationIssue(
-                field=field_name,
-                message=f"Value {value} is greater than maximum {max_value}.",
-                rule=dict(rule),
-            )
+        yield ValidationIssue(
+            field=field_name,
+            message=f"Value {value} is greater than maximum {max_value}.",
+            rule=plan.rule,
         )
 
 
 def _validate_float(
     field_name: str,
     value: Any,
-    rule: Mapping[str, Any],
-    issues: List[ValidationIssue],
-) -> None:
-    if not isinstance(value, (int, float)):
-        issues.append(
-            ValidationIssue(
-                field=field_name,
-                message=f"Expected float, got {type(value).__name__}.",
-                rule=dict(rule),
-            )
+    plan: _FloatPlan,
+    ctx: _Context,
+) -> Iterator[ValidationIssue]:
+    if not _is_number(value):
+        yield ValidationIssue(
+            field=field_name,
+            message=_type_mismatch("float", type(value).__name__),
+            rule=plan.rule,
+        )
+        return
+
+    if plan.invalid_bounds:
+        yield ValidationIssue(
+            field=field_name,
+            message=_MSG_FLOAT_BOUNDS_NOT_NUMBERS,
+            rule=plan.rule,
         )
         return
 
     numeric_value = float(value)
-    min_value = rule.get("min")
-    max_value = rule.get("max")
+    if plan.lo <= numeric_value <= plan.hi:
+        return
 
-    if min_value is not None and numeric_value < float(min_value):
-        issues.append(
-            ValidationIssue(
-                field=field_name,
-                message=f"Value {numeric_value} is less than minimum {min_value}.",
-                rule=dict(rule),
-            )
+    # Messages quote the bounds as written in the schema.
+    if plan.min is not None and numeric_value < plan.min:
+        yield ValidationIssue(
+            field=field_name,
+            message=f"Value {numeric_value} is less than minimum {plan.min_as_written}.",
+            rule=plan.rule,
         )
-    if max_value is not None and numeric_value > float(max_value):
-        issues.append(
-            ValidationIssue(
-                field=field_name,
-                message=f"Value {numeric_value} is greater than maximum {max_value}.",
-                rule=dict(rule),
-            )
+    if plan.max is not None and numeric_value > plan.max:
+        yield ValidationIssue(
+            field=field_name,
+            message=f"Value {numeric_value} is greater than maximum {plan.max_as_written}.",
+            rule=plan.rule,
         )
 
 
 def _validate_bool(
     field_name: str,
     value: Any,
-    rule: Mapping[str, Any],
-    issues: List[ValidationIssue],
-) -> None:
+    plan: _FieldPlan,
+    ctx: _Context,
+) -> Iterator[ValidationIssue]:
     if not isinstance(value, bool):
-        issues.append(
-            ValidationIssue(
-                field=field_name,
-                message=f"Expected bool, got {type(value).__name__}.",
-                rule=dict(rule),
-            )
+        yield ValidationIssue(
+            field=field_name,
+            message=_type_mismatch("bool", type(value).__name__),
+            rule=plan.rule,
         )
 
 
 def _validate_enum(
     field_name: str,
     value: Any,
-    rule: Mapping[str, Any],
-    issues: List[ValidationIssue],
-) -> None:
-    allowed = rule.get("allowed")
-    if not isinstance(allowed, Iterable) or isinstance(allowed, (str, bytes)):
-        issues.append(
-            ValidationIssue(
-                field=field_name,
-                message="Schema error: 'allowed' must be a list/sequence for enum type.",
-                rule=dict(rule),
-            )
+    plan: _EnumPlan,
+    ctx: _Context,
+) -> Iterator[ValidationIssue]:
+    if plan.allowed is None:
+        yield ValidationIssue(
+            field=field_name,
+            message=_MSG_ENUM_ALLOWED_NOT_LIST,
+            rule=plan.rule,
         )
         return
 
-    allowed_values = list(allowed)
-    if value not in allowed_values:
-        issues.append(
-            ValidationIssue(
-                field=field_name,
-                message=f"Value {value!r} not in allowed set {allowed_values!r}.",
-                rule=dict(rule),
-            )
+    if not _enum_contains(plan, value):
+        yield ValidationIssue(
+            field=field_name,
+            message=f"Value {value!r} not in allowed set {list(plan.allowed)!r}.",
+            rule=plan.rule,
         )
 
 
+def _enum_contains(plan: _EnumPlan, value: Any) -> bool:
+    """Return whether ``value`` is one of the plan's allowed values."""
+    if plan.allowed_set is not None:
+        try:
+            return value in plan.allowed_set
+        except TypeError:
+            # Unhashable config value; fall back to an equality scan.
+            pass
+    return value in plan.allowed  # type: ignore[operator]
+
+
 def _validate_file(
     field_name: str,
     value: Any,
-    rule: Mapping[str, Any],
-    issues: List[ValidationIssue],
-) -> None:
+    plan: _FilePlan,
+    ctx: _Context,
+) -> Iterator[ValidationIssue]:
     if not isinstance(value, str):
-        issues.append(
-            ValidationIssue(
-                field=field_name,
-                message=f"Expected file path string, got {type(value).__name__}.",
-                rule=dict(rule),
-            )
+        yield ValidationIssue(
+            field=field_name,
+            message=_type_mismatch("file path string", type(value).__name__),
+            rule=plan.rule,
         )
         return
 
-    path = Path(value)
-
-    if rule.get("must_be_absolute", False) and not path.is_absolute():
-        issues.append(
-            ValidationIssue(
-                field=field_name,
-                message="File path must be absolute.",
-                rule=dict(rule),
-            )
+    if plan.must_be_absolute and not os.path.isabs(value):
+        yield ValidationIssue(
+            field=field_name,
+            message=_MSG_FILE_NOT_ABSOLUTE,
+            rule=plan.rule,
         )
 
-    if rule.get("must_exist", False) and not path.exists():
-        issues.append(
-            ValidationIssue(
-                field=field_name,
-                message=f"File does not exist: {value}.",
-                rule=dict(rule),
-            )
+    # A single stat serves both the existence and the size checks.
+    st: Optional[os.stat_result] = None
+    stat_failed = False
+    if plan.must_exist or plan.non_empty:
+        st, stat_failed = _stat(value, ctx)
+
+    if plan.must_exist and st is None and not stat_failed:
+        yield ValidationIssue(
+            field=field_name,
+            message=f"File does not exist: {value}.",
+            rule=plan.rule,
         )
         # If it does not exist, subsequent checks are not meaningful.
         return
 
-    if rule.get("must_be_readable", False) and not os.access(path, os.R_OK):
-        issues.append(
-            ValidationIssue(
-                field=field_name,
-                message=f"File is not readable: {value}.",
-                rule=dict(rule),
-            )
+    if plan.must_be_readable and not _is_readable(value, ctx):
+        yield ValidationIssue(
+            field=field_name,
+            message=f"File is not readable: {value}.",
+            rule=plan.rule,
         )
 
-    if rule.get("non_empty", False) and path.exists():
-        try:
-            size = path.stat().st_size
-        except OSError:
-            issues.append(
-                ValidationIssue(
-                    field=field_name,
-                    message=f"Unable to stat file: {value}.",
-                    rule=dict(rule),
-                )
-            )
-        else:
-            if size == 0:
-                issues.append(
-                    ValidationIssue(
-                        field=field_name,
-                        message=f"File is empty: {value}.",
-                        rule=dict(rule),
-                    )
-                )
+    if stat_failed:
+        yield ValidationIssue(
+            field=field_name,
+            message=f"Unable to stat file: {value}.",
+            rule=plan.rule,
+        )
+    elif plan.non_empty and st is not None and st.st_size == 0:
+        yield ValidationIssue(
+            field=field_name,
+            message=f"File is empty: {value}.",
+            rule=plan.rule,
+        )
 
-    extensions = rule.get("extensions")
-    if extensions:
-        valid_exts = [str(ext) for ext in extensions]
-        if not any(str(value).endswith(ext) for ext in valid_exts):
-            issues.append(
-                ValidationIssue(
-                    field=field_name,
-                    message=f"File extension not in allowed set {valid_exts!r}.",
-                    rule=dict(rule),
-                )
-            )
+    if plan.invalid_extensions:
+        yield ValidationIssue(
+            field=field_name,
+            message=_MSG_FILE_EXTENSIONS_NOT_LIST,
+            rule=plan.rule,
+        )
+    elif plan.extensions and not value.endswith(plan.extensions):
+        yield ValidationIssue(
+            field=field_name,
+            message=f"File extension not in allowed set {list(plan.extensions)!r}.",
+            rule=plan.rule,
+        )
+
+
+def _stat(path: str, ctx: _Context) -> Tuple[Optional[os.stat_result], bool]:
+    """Stat ``path`` once per validation call; see :func:`_stat_uncached`."""
+    cached = ctx.stat_cache.get(path)
+    if cached is None:
+        cached = ctx.stat_cache[path] = _stat_uncached(path)
+    return cached
+
+
+def _fs_path(path: str) -> str:
+    """Return the path the filesystem calls should use for ``path``."""
+    # Matches ``pathlib.Path``, which these checks originally went through:
+    # an empty string names the current directory and trailing separators
+    # are dropped. Other paths are passed through as-is, which avoids
+    # building a Path per check.
+    if path and path[-1] not in _PATH_SEPARATORS:
+        return path
+    return os.fspath(Path(path))
+
+
+def _stat_uncached(path: str) -> Tuple[Optional[os.stat_result], bool]:
+    """Stat ``path``, returning a ``(stat_result, stat_failed)`` pair."""
+    # ``stat_result`` is None if the path does not exist or could not be
+    # stat'ed; ``stat_failed`` is True only for errors other than a missing
+    # path.
+    try:
+        return os.stat(_fs_path(path)), False
+    except OSError as exc:
+        # Same errors ``Path.exists()`` treats as a missing path.
+        if exc.errno in _MISSING_PATH_ERRNOS:
+            return None, False
+        return None, True
+    except ValueError:
+        # E.g. an embedded null byte; ``Path.exists()`` reports False.
+        return None, False
+
+
+def _is_readable_uncached(path: str) -> bool:
+    """Check read access to ``path``."""
+    return os.access(_fs_path(path), os.R_OK)
+
+
+def _prefetch_file_checks(items: List[Any], plan: _FilePlan, ctx: _Context) -> None:
+    """Run the filesystem calls for a long list of files concurrently."""
+    # ``os.stat`` and ``os.access`` release the GIL, so on slow (e.g.
+    # network) filesystems overlapping them in a thread pool cuts wall
+    # time. Results land in the context caches, where the per-item checks
+    # pick them up. Short lists are left alone to avoid the pool start-up
+    # cost.
+    # Mirror the serial checks: only stat when existence or size is
+    # checked, and skip readability for files already known to be missing.
+    needs_stat = plan.must_exist or plan.non_empty
+    if not (needs_stat or plan.must_be_readable):
+        return
+
+    paths = dict.fromkeys(item for item in items if isinstance(item, str))
+    cache = ctx.stat_cache if needs_stat else ctx.readable_cache
+    pending = [path for path in paths if path not in cache]
+    if len(pending) < _PARALLEL_FILE_CHECK_MIN_ITEMS:
+        return
+
+    with ThreadPoolExecutor(max_workers=_PARALLEL_FILE_CHECK_WORKERS) as executor:
+        if needs_stat:
+            ctx.stat_cache.update(zip(pending, executor.map(_stat_uncached, pending)))
+        if plan.must_be_readable:
+            to_check = pending
+            if plan.must_exist:
+                to_check = [p for p in pending if ctx.stat_cache[p][0] is not None]
+            ctx.readable_cache.update(zip(to_check, executor.map(_is_readable_uncached, to_check)))
+
+
+def _is_readable(path: str, ctx: _Context) -> bool:
+    """Check read access to ``path`` once per validation call."""
+    readable = ctx.readable_cache.get(path)
+    if readable is None:
+        readable = ctx.readable_cache[path] = _is_readable_uncached(path)
+    return readable
 
 
 def _validate_directory(
     field_name: str,
     value: Any,
-    rule: Mapping[str, Any],
-    issues: List[ValidationIssue],
-) -> None:
+    plan: _DirectoryPlan,
+    ctx: _Context,
+) -> Iterator[ValidationIssue]:
     if not isinstance(value, str):
-        issues.append(
-            ValidationIssue(
-                field=field_name,
-                message=f"Expected directory path string, got {type(value).__name__}.",
-                rule=dict(rule),
-            )
+        yield ValidationIssue(
+            field=field_name,
+            message=_type_mismatch("directory path string", type(value).__name__),
+            rule=plan.rule,
         )
         return
 
-    path = Path(value)
-
-    if rule.get("must_be_absolute", False) and not path.is_absolute():
-        issues.append(
-            ValidationIssue(
-                field=field_name,
-                message="Directory path must be absolute.",
-                rule=dict(rule),
-            )
+    if plan.must_be_absolute and not os.path.isabs(value):
+        yield ValidationIssue(
+            field=field_name,
+            message=_MSG_DIR_NOT_ABSOLUTE,
+            rule=plan.rule,
         )
 
-    if rule.get("must_exist", False) and not path.is_dir():
-        issues.append(
-            ValidationIssue(
-                field=field_name,
-                message=f"Directory does not exist or is not a directory: {value}.",
-                rule=dict(rule),
-            )
+    if plan.must_exist and not os.path.isdir(_fs_path(value)):
+        yield ValidationIssue(
+            field=field_name,
+            message=f"Directory does not exist or is not a directory: {value}.",
+            rule=plan.rule,
         )
 
 
 def _validate_list(
     field_name: str,
     value: Any,
-    rule: Mapping[str, Any],
-    issues: List[ValidationIssue],
-) -> None:
+    plan: _ListPlan,
+    ctx: _Context,
+) -> Iterator[ValidationIssue]:
     if not isinstance(value, list):
-        issues.append(
-            ValidationIssue(
-                field=field_name,
-                message=f"Expected list, got {type(value).__name__}.",
-                rule=dict(rule),
-            )
+        yield ValidationIssue(
+            field=field_name,
+            message=_type_mismatch("list", type(value).__name__),
+            rule=plan.rule,
         )
         return
 
-    min_items = rule.get("min_items")
-    max_items = rule.get("max_items")
+    min_items = plan.min_items
+    max_items = plan.max_items
 
-    if isinstance(min_items, int) and len(value) < min_items:
-        issues.append(
-            ValidationIssue(
-                field=field_name,
-                message=f"List has fewer than minimum {min_items} items.",
-                rule=dict(rule),
-            )
+    if min_items is not None and len(value) < min_items:
+        yield ValidationIssue(
+            field=field_name,
+            message=f"List has fewer than minimum {min_items} items.",
+            rule=plan.rule,
         )
 
-    if isinstance(max_items, int) and len(value) > max_items:
-        issues.append(
-            ValidationIssue(
-                field=field_name,
-                message=f"List has more than maximum {max_items} items.",
-                rule=dict(rule),
-            )
+    if max_items is not None and len(value) > max_items:
+        yield ValidationIssue(
+            field=field_name,
+            message=f"List has more than maximum {max_items} items.",
+            rule=plan.rule,
         )
 
-    element_type = rule.get("element_type")
-    if not element_type:
+    element = plan.element
+    if element is None:
         return
 
-    # Reuse existing validators where possible.
+    if element.type_id == FieldType.FILE and len(value) >= _PARALLEL_FILE_CHECK_MIN_ITEMS:
+        _prefetch_file_checks(value, element, ctx)  # type: ignore[arg-type]
+
+    # Items are validated directly against the precompiled element plan;
+    # no per-item config mapping or context is needed.
     for idx, item in enumerate(value):
-        element_field_name = f"{field_name}[{idx}]"
-        element_rule: Dict[str, Any] = dict(rule)
-        element_rule["type"] = element_type
-        # List-level constraints do not apply per element.
-        element_rule.pop("min_items", None)
-        element_rule.pop("max_items", None)
-
-        _validate_field(
-            field_name=element_field_name,
-            rule=element_rule,
-            config={element_field_name: item},
-            ctx=_Context(allow_extra_keys=True),
-            issues=issues,
-        )
+        yield from _validate_value(f"{field_name}[{idx}]", item, element, ctx)
+
+
+# --------------------------------------------------------------------------- #
+# One-shot path
+# --------------------------------------------------------------------------- #
+
+
+def _iter_issues_uncompiled(
+    schema: Mapping[str, Any],
+    config: Mapping[str, Any],
+    allow_extra_keys: bool,
+) -> Iterator[ValidationIssue]:
+    """Yield the issues :meth:`Validator.iter_issues` would, without compiling."""
+    # A one-shot call would pay to compile every rule only to use each plan
+    # once. Scalar rules are instead checked straight from the schema
+    # mapping, copying the rule only when it produces an issue; other rule
+    # types compile just the visited field and reuse the compiled checks.
+    ctx = _Context(allow_extra_keys=allow_extra_keys)
+
+    for field_name, rule in schema.items():
+        # Skip reserved / meta keys (convention: leading underscores).
+        if isinstance(field_name, str) and field_name.startswith("_"):
+            continue
+        rule = rule or {}
+
+        if field_name not in config:
+            if rule.get("required", False):
+                yield ValidationIssue(field=field_name, message=_MSG_MISSING, rule=dict(rule))
+            continue
+
+        value = config.get(field_name)
+        if value is None:
+            if rule.get("required", False):
+                yield ValidationIssue(field=field_name, message=_MSG_NULL, rule=dict(rule))
+            continue
+
+        type_name = rule.get("type", "string")
+        check = _UNCOMPILED_DISPATCH.get(type_name) if type(type_name) is str else None
+        if check is not None:
+            messages = check(value, rule)
+            if messages:
+                # One copy of the rule, shared by the field's issues.
+                snapshot = dict(rule)
+                for message in messages:
+                    yield ValidationIssue(field=field_name, message=message, rule=snapshot)
+        else:
+            yield from _validate_value(field_name, value, _compile_rule(rule), ctx)
+
+    if not allow_extra_keys:
+        for field_name in config.keys():
+            if field_name not in schema:
+                yield ValidationIssue(
+                    field=field_name,
+                    message=_MSG_UNEXPECTED_KEY,
+                    rule=None,
+                )
+
+
+# The ``_check_*`` functions below mirror the compiled ``_validate_*``
+# handlers for the same rule type, returning the issue messages for one
+# value.
+
+
+def _check_string(value: Any, rule: Mapping[str, Any]) -> Sequence[str]:
+    if not isinstance(value, str):
+        return (_type_mismatch("string", type(value).__name__),)
+
+    min_length = rule.get("min_length")
+    max_length = rule.get("max_length")
+    pattern = rule.get("regex")
+    if min_length is None and max_length is None and not pattern:
+        return ()
+
+    messages = []
+    if isinstance(min_length, int) and len(value) < min_length:
+        messages.append(f"String shorter than minimum length {min_length}.")
+    if isinstance(max_length, int) and len(value) > max_length:
+        messages.append(f"String longer than maximum length {max_length}.")
+    if pattern:
+        pattern = str(pattern)
+        regex, regex_error = _compile_pattern(pattern)
+        if regex is None:
+            messages.append(f"Invalid regex in schema: {regex_error}.")
+        elif regex.fullmatch(value) is None:
+            messages.append(f"Value does not match regex pattern {pattern!r}.")
+    return messages
+
+
+def _check_int(value: Any, rule: Mapping[str, Any]) -> Sequence[str]:
+    if not _is_int(value):
+        return (_type_mismatch("int", type(value).__name__),)
+
+    min_value = rule.get("min")
+    max_value = rule.get("max")
+    messages = []
+    if min_value is not None and value < min_value:
+        messages.append(f"Value {value} is less than minimum {min_value}.")
+    if max_value is not None and value > max_value:
+        messages.append(f"Value {value} is greater than maximum {max_value}.")
+    return messages
+
+
+def _check_float(value: Any, rule: Mapping[str, Any]) -> Sequence[str]:
+    if not _is_number(value):
+        return (_type_mismatch("float", type(value).__name__),)
+
+    min_as_written = rule.get("min")
+    max_as_written = rule.get("max")
+    if min_as_written is None and max_as_written is None:
+        return ()
+    try:
+        min_value = _as_float(min_as_written)
+        max_value = _as_float(max_as_written)
+    except (TypeError, ValueError):
+        return (_MSG_FLOAT_BOUNDS_NOT_NUMBERS,)
+
+    numeric_value = float(value)
+    messages = []
+    if min_value is not None and numeric_value < min_value:
+        messages.append(f"Value {numeric_value} is less than minimum {min_as_written}.")
+    if max_value is not None and numeric_value > max_value:
+        messages.append(f"Value {numeric_value} is greater than maximum {max_as_written}.")
+    return messages
+
+
+def _check_bool(value: Any, rule: Mapping[str, Any]) -> Sequence[str]:
+    if not isinstance(value, bool):
+        return (_type_mismatch("bool", type(value).__name__),)
+    return ()
+
+
+def _check_enum(value: Any, rule: Mapping[str, Any]) -> Sequence[str]:
+    allowed = rule.get("allowed")
+    if type(allowed) is not list and type(allowed) is not tuple:
+        if not isinstance(allowed, Iterable) or isinstance(allowed, (str, bytes)):
+            return (_MSG_ENUM_ALLOWED_NOT_LIST,)
+        # Sets would reject unhashable values; scan a tuple like the
+        # compiled check's fallback does.
+        allowed = tuple(allowed)
+    if value in allowed:
+        return ()
+    return (f"Value {value!r} not in allowed set {list(allowed)!r}.",)
+
+
+# Type dispatch table; ``dir``/``directory`` both resolve to
+# FieldType.DIRECTORY at compile time.
+_DISPATCH: Dict[FieldType, _Handler] = {
+    FieldType.STRING: _validate_string,
+    FieldType.INT: _validate_int,
+    FieldType.FLOAT: _validate_float,
+    FieldType.BOOL: _validate_bool,
+    FieldType.ENUM: _validate_enum,
+    FieldType.FILE: _validate_file,
+    FieldType.DIRECTORY: _validate_directory,
+    FieldType.LIST: _validate_list,
+}
+
+# Used instead of _DISPATCH for plans with ``needs_deep_check`` unset.
+_TYPE_ONLY_DISPATCH: Dict[FieldType, _Handler] = {
+    **_DISPATCH,
+    FieldType.STRING: _type_only("string", _is_str),
+    FieldType.INT: _type_only("int", _is_int),
+    FieldType.FLOAT: _type_only("float", _is_number),
+    FieldType.LIST: _type_only("list", _is_list),
+}
+
+# Rule types the one-shot path checks without compiling; ``dir``,
+# ``directory``, ``file``, ``list`` and unsupported types compile the
+# visited field instead.
+_UNCOMPILED_DISPATCH: Dict[str, Callable[[Any, Mapping[str, Any]], Sequence[str]]] = {
+    "string": _check_string,
+    "int": _check_int,
+    "float": _check_float,
+    "bool": _check_bool,
+    "enum": _check_enum,
+}
@@ -0,0 +1,21 @@
+import functools
+import re
+
+import pytest
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_union(needles, flags=0):
+    return re.compile("|".join(map(re.escape, needles)), flags)
+
+
+def _assert_issue(issues, *needles, ignore_case=False):
+    """Assert that at least one of ``needles`` appears in the rendered issues."""
+    blob = "\n".join(map(str, issues))
+    flags = re.IGNORECASE if ignore_case else 0
+    assert _compile_union(needles, flags).search(blob), blob
+
+
+@pytest.fixture(scope="session")
+def assert_issue():
+    return _assert_issue
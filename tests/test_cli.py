@@ -1,4 +1,4 @@
-import yaml
+import json
 from pathlib import Path
 from typer.testing import CliRunner
 
@@ -7,11 +7,11 @@ from jps_yaml_schema_validator.cli import app
 runner = CliRunner()
 
 
-def write_yaml(path: Path, data: dict) -> None:
-    path.write_text(
-        yaml.safe_dump(data, sort_keys=False),
-        encoding="utf-8",
-    )
+def write_json_fixture(path: Path, data: dict) -> None:
+    # The CLI loads these files with the YAML loader; YAML is a superset of
+    # JSON. Avoid floats in exponent notation ("1e-05"), which PyYAML's
+    # YAML 1.1 resolver reads back as strings.
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
 
 
 def test_cli_valid(tmp_path: Path):
@@ -22,8 +22,8 @@ def test_cli_valid(tmp_path: Path):
     s = tmp_path / "schema.yaml"
     c = tmp_path / "config.yaml"
 
-    write_yaml(s, schema)
-    write_yaml(c, config)
+    write_json_fixture(s, schema)
+    write_json_fixture(c, config)
 
     result = runner.invoke(
         app,
@@ -44,8 +44,8 @@ def test_cli_invalid(tmp_path: Path):
     s = tmp_path / "schema.yaml"
     c = tmp_path / "config.yaml"
 
-    write_yaml(s, schema)
-    write_yaml(c, config)
+    write_json_fixture(s, schema)
+    write_json_fixture(c, config)
 
     result = runner.invoke(
         app,
@@ -65,8 +65,8 @@ def test_cli_disallow_extra_keys(tmp_path: Path):
     s = tmp_path / "schema.yaml"
     c = tmp_path / "config.yaml"
 
-    write_yaml(s, schema)
-    write_yaml(c, config)
+    write_json_fixture(s, schema)
+    write_json_fixture(c, config)
 
     result = runner.invoke(
         app,
@@ -104,7 +104,7 @@ def test_cli_invalid_config_yaml(tmp_path: Path):
     s = tmp_path / "schema.yaml"
     c = tmp_path / "config.yaml"
 
-    write_yaml(s, schema)
+    write_json_fixture(s, schema)
     c.write_text(":: bad yaml ::", encoding="utf-8")
 
     result = runner.invoke(
@@ -116,3 +116,53 @@ def test_cli_invalid_config_yaml(tmp_path: Path):
     assert result.exit_code == 2
     output = result.stdout.lower()
     assert "invalid yaml" in output
+
+
+def test_cli_non_ascii_config(tmp_path: Path):
+    """UTF-8 content should round-trip through the byte-based loader."""
+    schema = {"name": {"type": "enum", "required": True, "allowed": ["ünïcode"]}}
+    s = tmp_path / "schema.yaml"
+    c = tmp_path / "config.yaml"
+
+    write_json_fixture(s, schema)
+    c.write_text("name: ünïcode\n", encoding="utf-8")
+
+    result = runner.invoke(
+        app,
+        ["-s", str(s), "-c", str(c)],
+        prog_name="jps-yaml-schema-validate",
+    )
+
+    assert result.exit_code == 0
+
+
+def test_cli_max_issues(tmp_path: Path):
+    """--max-issues should cap the number of reported issues."""
+    schema = {name: {"type": "string", "required": True} for name in ("a", "b", "c")}
+    s = tmp_path / "schema.yaml"
+    c = tmp_path / "config.yaml"
+
+    write_json_fixture(s, schema)
+    write_json_fixture(c, {"unused": True})
+
+    result = runner.invoke(
+        app,
+        ["-s", str(s), "-c", str(c), "--max-issues", "2"],
+        prog_name="jps-yaml-schema-validate",
+    )
+
+    assert result.exit_code == 1
+    output = result.stdout.lower()
+    assert output.count("missing required") == 2
+    assert "stopped after 2 issues" in output
+
+    result = runner.invoke(
+        app,
+        ["-s", str(s), "-c", str(c), "--max-issues", "3"],
+        prog_name="jps-yaml-schema-validate",
+    )
+
+    assert result.exit_code == 1
+    output = result.stdout.lower()
+    assert output.count("missing required") == 3
+    assert "stopped after" not in output
@@ -0,0 +1,281 @@
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+from jps_yaml_schema_validator import (
+    SchemaValidationError,
+    Validator,
+    compile_schema,
+    iter_issues,
+    validate_batch,
+)
+from jps_yaml_schema_validator._plan import FieldType
+from jps_yaml_schema_validator.validator import validate_config_against_schema
+
+SCHEMA = {
+    "_meta": {"version": 1},
+    "name": {"type": "string", "required": True, "regex": "^[a-z]+$"},
+    "threshold": {"type": "float", "min": 0, "max": 1},
+    "outdir": {"type": "dir"},
+    "genes": {"type": "list", "element_type": "string", "min_items": 1},
+}
+
+
+def plans(schema):
+    return [plan for _, plan in compile_schema(schema).public_fields]
+
+
+def test_compile_schema_skips_meta_keys():
+    fields = compile_schema(SCHEMA).public_fields
+    assert [name for name, _ in fields] == ["name", "threshold", "outdir", "genes"]
+
+
+def test_compile_schema_resolves_types():
+    name, threshold, outdir, genes = plans(SCHEMA)
+    assert name.type_id == FieldType.STRING
+    assert name.regex is not None and name.regex.pattern == "^[a-z]+$"
+    assert threshold.min == 0.0 and threshold.max == 1.0
+    assert outdir.type_id == FieldType.DIRECTORY
+    assert genes.element.type_id == FieldType.STRING
+    assert "min_items" not in genes.element.rule
+
+
+def test_validator_reuse_matches_function():
+    validator = Validator(SCHEMA)
+    for config in ({"name": "abc", "genes": ["x"]}, {"name": "ABC", "threshold": 2}):
+        assert validator.validate(config) == validate_config_against_schema(SCHEMA, config)
+
+
+@pytest.mark.parametrize(
+    "rule, value",
+    [
+        ({"type": "string", "min_length": 2, "max_length": 3, "regex": "^a"}, "bbbb"),
+        ({"type": "string", "min_length": "2", "regex": "["}, "x"),
+        ({"type": "string"}, 1),
+        ({"type": "int", "min": 1, "max": 3}, 0),
+        ({"type": "int", "max": 1.5}, 2),
+        ({"type": "int"}, True),
+        ({"type": "float", "min": 0, "max": 1}, 2),
+        ({"type": "float", "min": "abc"}, 0.5),
+        ({"type": "float"}, "x"),
+        ({"type": "bool"}, 0),
+        ({"type": "enum", "allowed": ("a", ["b"])}, "z"),
+        ({"type": "enum", "allowed": {"a"}}, "z"),
+        ({"type": "enum", "allowed": "ab"}, "a"),
+        ({"type": "list", "element_type": "int", "min_items": 3}, [1, "x"]),
+        ({"type": "file", "extensions": [".fa"]}, "ref.txt"),
+        ({"type": "dir", "must_be_absolute": True}, "out"),
+        ({"type": "mystery"}, 1),
+        ({"type": "string", "required": True}, None),
+        (None, 1),
+    ],
+)
+def test_one_shot_matches_compiled_validator(rule, value):
+    schema = {"x": rule, "y": {"type": "int", "required": True}}
+    config = {"x": value, "z": 1}
+    expected = Validator(schema).validate(config, allow_extra_keys=False)
+    assert validate_config_against_schema(schema, config, allow_extra_keys=False) == expected
+    assert list(iter_issues(schema, config, allow_extra_keys=False)) == expected
+
+
+def test_float_bound_message_uses_schema_value():
+    issues = Validator(SCHEMA).validate({"name": "abc", "threshold": 2})
+    assert [str(i) for i in issues] == ["threshold: Value 2.0 is greater than maximum 1."]
+
+
+def test_nested_list_element_type():
+    schema = {"x": {"type": "list", "element_type": "list"}}
+    issues = Validator(schema).validate({"x": [[[]], 1]})
+    assert [str(i) for i in issues] == ["x[1]: Expected list, got int."]
+
+
+def test_nested_list_plans_compare_and_repr():
+    schema = {"x": {"type": "list", "element_type": "list", "min_items": 1}}
+    assert compile_schema(schema) == compile_schema(dict(schema))
+    assert compile_schema(schema) != compile_schema({"x": {"type": "list", "element_type": "int"}})
+    (plan,) = plans(schema)
+    assert plan.element.element is plan.element
+    assert repr(plan).count("_ListPlan(") == 2
+
+
+def test_regex_compiled_once_across_schemas():
+    schema = {"x": {"type": "string", "regex": "^[0-9]+-cached$"}}
+    (first,) = plans(schema)
+    (second,) = plans(dict(schema))
+    assert first.regex is second.regex
+
+
+def test_invalid_regex_is_cached_as_error():
+    schema = {"x": {"type": "string", "regex": "["}}
+    (first,) = plans(schema)
+    (second,) = plans(schema)
+    assert first.regex is None and first.regex_error == second.regex_error
+
+
+def test_issue_rule_is_shared_snapshot():
+    schema = {"x": {"type": "list", "element_type": "int"}}
+    issues = Validator(schema).validate({"x": ["a", "b"]})
+    assert len(issues) == 2
+    assert issues[0].rule is issues[1].rule
+    assert issues[0].rule == {"type": "int", "element_type": "int"}
+    assert issues[0].rule is not schema["x"]
+
+
+def test_issues_pickle_copy_and_asdict():
+    issues = Validator(SCHEMA).validate({"name": "ABC", "genes": [1]})
+    assert len(issues) == 2
+    assert pickle.loads(pickle.dumps(issues)) == issues
+    assert copy.deepcopy(issues) == issues
+    assert dataclasses.asdict(issues[0]) == {
+        "field": "name",
+        "message": "Value does not match regex pattern '^[a-z]+$'.",
+        "rule": SCHEMA["name"],
+    }
+
+    error = pickle.loads(pickle.dumps(SchemaValidationError(issues)))
+    assert error.issues == issues
+    assert str(error) == str(SchemaValidationError(issues))
+
+
+def test_list_null_items_follow_list_required_flag():
+    optional = {"x": {"type": "list", "element_type": "int"}}
+    required = {"x": {"type": "list", "element_type": "int", "required": True}}
+    assert Validator(optional).validate({"x": [1, None]}) == []
+    issues = Validator(required).validate({"x": [1, None]})
+    assert [str(i) for i in issues] == ["x[1]: Required field is null."]
+
+
+def test_compiled_schema_keys_include_meta_keys():
+    compiled = compile_schema(SCHEMA)
+    assert compiled.schema_keys == frozenset(SCHEMA)
+    config = {"name": "abc", "_meta": 1, "zz": 1, "aa": 2}
+    issues = Validator(SCHEMA).validate(config, allow_extra_keys=False)
+    assert [i.field for i in issues] == ["zz", "aa"]
+
+
+def test_enum_membership_with_unhashable_values():
+    hashable = {"x": {"type": "enum", "allowed": ["a", "b"]}}
+    unhashable = {"x": {"type": "enum", "allowed": ["a", ["b", "c"]]}}
+    assert Validator(hashable).validate({"x": "b"}) == []
+    assert len(Validator(hashable).validate({"x": ["b"]})) == 1
+    assert Validator(unhashable).validate({"x": ["b", "c"]}) == []
+    issues = Validator(unhashable).validate({"x": "z"})
+    assert [str(i) for i in issues] == ["x: Value 'z' not in allowed set ['a', ['b', 'c']]."]
+
+
+def test_numeric_bounds_default_to_infinity():
+    schema = {"i": {"type": "int", "min": 1}, "f": {"type": "float", "max": 2}}
+    validator = Validator(schema)
+    # The missing bound on each side places no limit on the value.
+    assert validator.validate({"i": 10**400, "f": -1e308}) == []
+    assert validator.validate({"i": 1, "f": float("-inf")}) == []
+    issues = validator.validate({"i": 0, "f": 3})
+    assert [str(x) for x in issues] == [
+        "i: Value 0 is less than minimum 1.",
+        "f: Value 3.0 is greater than maximum 2.",
+    ]
+
+
+def test_validate_batch_matches_per_config_results():
+    configs = [{"name": "abc"}, {"threshold": -1}, {"name": "ok", "extra": 1}]
+    results = validate_batch(SCHEMA, configs, allow_extra_keys=False)
+    assert results == [
+        validate_config_against_schema(SCHEMA, c, allow_extra_keys=False) for c in configs
+    ]
+    assert results[0] == []
+
+
+def test_type_only_rules_skip_deep_checks():
+    schema = {
+        "s": {"type": "string"},
+        "i": {"type": "int", "required": True},
+        "l": {"type": "list"},
+        "r": {"type": "string", "regex": "^a$"},
+        "g": {"type": "list", "element_type": "int"},
+    }
+    validator = Validator(schema)
+    issues = validator.validate({"s": 1, "i": "x", "l": (), "r": "a", "g": [1]})
+    assert [str(x) for x in issues] == [
+        "s: Expected string, got int.",
+        "i: Expected int, got str.",
+        "l: Expected list, got tuple.",
+    ]
+    # Rules with value constraints still run them.
+    issues = validator.validate({"s": "", "i": 1, "l": [1], "r": "b", "g": ["x"]})
+    assert [str(x) for x in issues] == [
+        "r: Value does not match regex pattern '^a$'.",
+        "g[0]: Expected int, got str.",
+    ]
+
+
+def test_validation_issue_has_no_instance_dict():
+    issue = Validator({"x": {"type": "int"}}).validate({"x": "a"})[0]
+    assert not hasattr(issue, "__dict__")
+
+
+def test_iter_issues_is_lazy():
+    schema = {"a": {"type": "int"}, "b": {"type": "list", "element_type": "int"}}
+    issues = iter_issues(schema, {"a": "x", "b": ["y"] * 3})
+    assert str(next(issues)) == "a: Expected int, got str."
+    assert [str(i) for i in issues] == [f"b[{n}]: Expected int, got str." for n in range(3)]
+
+
+def test_rules_equal_across_element_types_stay_distinct():
+    # frozenset({1}) == frozenset({True}), but each field must keep its own
+    # allowed values and rule snapshot.
+    schema = {
+        "a": {"type": "enum", "allowed": frozenset({1})},
+        "b": {"type": "enum", "allowed": frozenset({True})},
+        "e": {"type": "int", "min": 1},
+        "f": {"type": "int", "min": 1.0},
+    }
+    issues = Validator(schema).validate({"a": 2, "b": 2, "e": 0, "f": 0})
+    assert [str(i) for i in issues] == [
+        "a: Value 2 not in allowed set [1].",
+        "b: Value 2 not in allowed set [True].",
+        "e: Value 0 is less than minimum 1.",
+        "f: Value 0 is less than minimum 1.0.",
+    ]
+    assert issues[1].rule["allowed"] == frozenset({True})
+    assert next(iter(issues[1].rule["allowed"])) is True
+
+
+def test_non_numeric_float_bound_is_reported_not_raised():
+    schema = {"x": {"type": "float", "min": "abc"}, "y": {"type": "int"}}
+    validator = Validator(schema)
+    assert validator.validate({"y": 1}) == []
+    issues = validator.validate({"x": 0.5})
+    assert [str(i) for i in issues] == [
+        "x: Schema error: 'min'/'max' must be numbers for float type."
+    ]
+
+
+def test_validator_accepts_compiled_schema():
+    compiled = compile_schema(SCHEMA)
+    shared = [Validator(compiled), Validator(compiled)]
+    fresh = Validator(SCHEMA)
+    for config in ({"name": "ABC", "threshold": 2, "genes": []}, {"name": "abc"}):
+        expected = fresh.validate(config, allow_extra_keys=False)
+        for validator in shared:
+            assert validator.validate(config, allow_extra_keys=False) == expected
+
+
+def test_float_messages_ignore_later_rule_mutation():
+    validator = Validator({"x": {"type": "float", "max": 1}})
+    issues = validator.validate({"x": 2})
+    issues[0].rule["max"] = "CHANGED"
+    assert [str(i) for i in validator.validate({"x": 2})] == [
+        "x: Value 2.0 is greater than maximum 1."
+    ]
+
+
+def test_non_iterable_extensions_is_reported_not_raised():
+    schema = {"f": {"type": "file", "extensions": 5}, "y": {"type": "int"}}
+    validator = Validator(schema)
+    assert validator.validate({"y": 1}) == []
+    issues = validator.validate({"f": "ref.fa"})
+    assert [str(i) for i in issues] == [
+        "f: Schema error: 'extensions' must be a list/sequence for file type."
+    ]
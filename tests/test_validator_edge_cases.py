@@ -1,54 +1,192 @@
+import os
 import pytest
 from pathlib import Path
+from jps_yaml_schema_validator import validator as validator_module
 from jps_yaml_schema_validator.validator import validate_config_against_schema
 
 
-def test_unsupported_type():
+def test_unsupported_type(assert_issue):
     schema = {"x": {"type": "unknown"}}
     config = {"x": "value"}
     issues = validate_config_against_schema(schema, config)
-    assert any("Unsupported type" in str(i) for i in issues)
+    assert_issue(issues, "Unsupported type")
 
 
-def test_invalid_regex():
+def test_invalid_regex(assert_issue):
     schema = {"x": {"type": "string", "required": True, "regex": "["}}
     config = {"x": "hello"}
     issues = validate_config_against_schema(schema, config)
-    assert any("Invalid regex" in str(i) for i in issues)
+    assert_issue(issues, "Invalid regex")
 
 
-def test_file_value_wrong_type():
+def test_file_value_wrong_type(assert_issue):
     schema = {"x": {"type": "file", "required": True}}
     config = {"x": 123}
     issues = validate_config_against_schema(schema, config)
-    assert any("Expected file path string" in str(i) for i in issues)
+    assert_issue(issues, "Expected file path string")
 
 
-def test_directory_wrong_type():
+def test_directory_wrong_type(assert_issue):
     schema = {"x": {"type": "directory", "required": True}}
     config = {"x": 123}
     issues = validate_config_against_schema(schema, config)
-    assert any("Expected directory path string" in str(i) for i in issues)
+    assert_issue(issues, "Expected directory path string")
 
 
-def test_enum_allowed_not_list():
+def test_enum_allowed_not_list(assert_issue):
     schema = {"x": {"type": "enum", "allowed": "not a list"}}
     config = {"x": "anything"}
     issues = validate_config_against_schema(schema, config)
-    assert any("Schema error" in str(i) for i in issues)
+    assert_issue(issues, "Schema error")
 
 
-def test_directory_must_be_absolute(tmp_path):
+def test_directory_must_be_absolute(tmp_path, assert_issue):
     schema = {"x": {"type": "directory", "must_be_absolute": True, "must_exist": True}}
     d = tmp_path / "mydir"
     d.mkdir()
     config = {"x": str(d.relative_to(tmp_path))}
     issues = validate_config_against_schema(schema, config)
-    assert any("must be absolute" in str(i).lower() for i in issues)
+    assert_issue(issues, "must be absolute", ignore_case=True)
 
 
-def test_list_element_type_unsupported():
+def test_list_element_type_unsupported(assert_issue):
     schema = {"x": {"type": "list", "element_type": "unknown"}}
     config = {"x": ["a"]}
     issues = validate_config_against_schema(schema, config)
-    assert any("Unsupported type" in str(i) for i in issues)
+    assert_issue(issues, "Unsupported type")
+
+
+@pytest.fixture
+def stat_calls(monkeypatch):
+    """Record the paths passed to ``os.stat``."""
+    calls = []
+    real_stat = os.stat
+
+    def counting_stat(path, *args, **kwargs):
+        calls.append(path)
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", counting_stat)
+    return calls
+
+
+def test_file_checks_share_one_stat(tmp_path, stat_calls):
+    f = tmp_path / "ref.fa"
+    f.write_text(">chr1\n", encoding="utf-8")
+    schema = {"x": {"type": "file", "must_exist": True, "non_empty": True}}
+
+    issues = validate_config_against_schema(schema, {"x": str(f)})
+    assert issues == []
+    assert stat_calls == [str(f)]
+
+
+def test_file_stat_error_reported(tmp_path, monkeypatch, assert_issue):
+    schema = {"x": {"type": "file", "must_exist": True}}
+
+    def failing_stat(path, *args, **kwargs):
+        raise PermissionError(path)
+
+    monkeypatch.setattr(os, "stat", failing_stat)
+    issues = validate_config_against_schema(schema, {"x": str(tmp_path / "a.fa")})
+    assert_issue(issues, "Unable to stat file")
+
+
+def test_paths_resolve_like_pathlib(tmp_path, monkeypatch):
+    # "" names the current directory and trailing separators are ignored,
+    # as when these checks went through pathlib.Path.
+    monkeypatch.chdir(tmp_path)
+    f = tmp_path / "ref.fa"
+    f.write_text(">chr1\n", encoding="utf-8")
+    schema = {
+        "f": {"type": "file", "must_exist": True, "must_be_readable": True, "non_empty": True},
+        "d": {"type": "directory", "must_exist": True},
+    }
+    for config in ({"f": "", "d": ""}, {"f": f"{f}/", "d": f"{tmp_path}/"}):
+        assert validate_config_against_schema(schema, config) == []
+
+
+def test_symlink_loop_reported_as_missing(tmp_path):
+    loop = tmp_path / "loop.fa"
+    loop.symlink_to(loop)
+    schema = {"x": {"type": "file", "must_exist": True, "non_empty": True}}
+    issues = validate_config_against_schema(schema, {"x": str(loop)})
+    assert [str(i) for i in issues] == [f"x: File does not exist: {loop}."]
+
+
+@pytest.mark.parametrize("rule", [{"type": "int"}, {"type": "int", "min": 0}])
+def test_int_rejects_bool(rule):
+    issues = validate_config_against_schema({"x": rule}, {"x": True})
+    assert [str(i) for i in issues] == ["x: Expected int, got bool."]
+
+
+@pytest.mark.parametrize("rule", [{"type": "float"}, {"type": "float", "max": 2}])
+def test_float_rejects_bool_but_accepts_int(rule):
+    assert validate_config_against_schema({"x": rule}, {"x": 1}) == []
+    issues = validate_config_against_schema({"x": rule}, {"x": False})
+    assert [str(i) for i in issues] == ["x: Expected float, got bool."]
+
+
+def test_repeated_file_paths_stat_once_per_call(tmp_path, stat_calls):
+    f = tmp_path / "ref.fa"
+    f.write_text(">chr1\n", encoding="utf-8")
+    schema = {"x": {"type": "list", "element_type": "file", "must_exist": True}}
+    config = {"x": [str(f)] * 5 + [str(tmp_path / "missing.fa")] * 2}
+
+    issues = validate_config_against_schema(schema, config)
+    assert [i.field for i in issues] == ["x[5]", "x[6]"]
+    assert len(stat_calls) == 2
+
+
+@pytest.fixture
+def pool_runs(monkeypatch):
+    """Count thread pools started by the validator's file prefetch."""
+    runs = []
+    real_pool = validator_module.ThreadPoolExecutor
+
+    def spy_pool(*args, **kwargs):
+        runs.append(kwargs)
+        return real_pool(*args, **kwargs)
+
+    monkeypatch.setattr(validator_module, "ThreadPoolExecutor", spy_pool)
+    return runs
+
+
+def test_long_file_list_checks_match_serial_results(tmp_path, pool_runs):
+    files = []
+    for idx in range(40):
+        f = tmp_path / f"f{idx}.fa"
+        if idx % 10:
+            f.write_text(">chr1\n" if idx % 3 else "", encoding="utf-8")
+        files.append(str(f))
+    checks = {"must_exist": True, "must_be_readable": True, "non_empty": True}
+    rule = {"type": "file", **checks}
+    schema = {"x": {"type": "list", "element_type": "file", **checks}}
+
+    issues = validate_config_against_schema(schema, {"x": files})
+    serial = [
+        issue
+        for path in files
+        for issue in validate_config_against_schema({"x": rule}, {"x": path})
+    ]
+    assert [str(i).split(":")[1] for i in issues] == [str(i).split(":")[1] for i in serial]
+    assert {i.field for i in issues} >= {"x[0]", "x[10]", "x[3]"}
+    # Only the 40-item list is long enough for the pool.
+    assert len(pool_runs) == 1
+
+
+def test_long_file_list_readable_only_skips_stat(tmp_path, monkeypatch, pool_runs):
+    files = []
+    for idx in range(40):
+        f = tmp_path / f"f{idx}.fa"
+        f.write_text(">chr1\n", encoding="utf-8")
+        files.append(str(f))
+    files.append(str(tmp_path / "missing.fa"))
+    schema = {"x": {"type": "list", "element_type": "file", "must_be_readable": True}}
+
+    def no_stat(path, *args, **kwargs):
+        raise AssertionError(f"unexpected stat of {path}")
+
+    monkeypatch.setattr(os, "stat", no_stat)
+    issues = validate_config_against_schema(schema, {"x": files})
+    assert [i.field for i in issues] == ["x[40]"]
+    assert len(pool_runs) == 1
@@ -1,103 +1,119 @@
 import os
-from pathlib import Path
-import yaml
+from types import MappingProxyType
 import pytest
 
 from jps_yaml_schema_validator.validator import (
+    Validator,
     validate_config_against_schema,
     assert_valid_config,
 )
+from jps_yaml_schema_validator._plan import _compile_pattern
 from jps_yaml_schema_validator.exceptions import SchemaValidationError, ValidationIssue
 
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-def write_yaml(path: Path, data: dict) -> None:
-    path.write_text(yaml.dump(data), encoding="utf-8")
+# File payloads written by the fixtures.
+_FASTA_BYTES = b">chr1\nACGT\n"
+_EMPTY = b""
+_TXT = b"content"
 
 
 # ---------------------------------------------------------------------------
 # Base schema used in most tests
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def schema():
-    return {
-        "ref": {
-            "type": "file",
-            "required": True,
-            "must_exist": True,
-            "must_be_readable": True,
-            "non_empty": True,
-            "extensions": [".fa"],
-        },
-        "outdir": {
-            "type": "directory",
-            "required": True,
-            "must_exist": True,
-        },
-        "metric": {
-            "type": "enum",
-            "required": True,
-            "allowed": ["a", "b", "c"],
-        },
-        "name": {
-            "type": "string",
-            "required": True,
-            "min_length": 3,
-            "max_length": 8,
-            "regex": "^[A-Za-z]+$",
-        },
-        "count": {
-            "type": "int",
-            "required": True,
-            "min": 1,
-            "max": 5,
-        },
-        "threshold": {
-            "type": "float",
-            "required": True,
-            "min": 0.0,
-            "max": 1.0,
-        },
-        "flag": {
-            "type": "bool",
-            "required": True,
-        },
-        "genes": {
-            "type": "list",
-            "required": True,
-            "min_items": 1,
-            "max_items": 3,
-            "element_type": "string",
-        },
-        "floats": {
-            "type": "list",
-            "required": True,
-            "element_type": "float",
-            "min_items": 2,
-            "max_items": 4,
-        },
-    }
+    # Shared by every test; read-only so a test cannot leak mutations.
+    return MappingProxyType(
+        {
+            "ref": {
+                "type": "file",
+                "required": True,
+                "must_exist": True,
+                "must_be_readable": True,
+                "non_empty": True,
+                "extensions": [".fa"],
+            },
+            "outdir": {
+                "type": "directory",
+                "required": True,
+                "must_exist": True,
+            },
+            "metric": {
+                "type": "enum",
+                "required": True,
+                "allowed": ["a", "b", "c"],
+            },
+            "name": {
+                "type": "string",
+                "required": True,
+                "min_length": 3,
+                "max_length": 8,
+                "regex": "^[A-Za-z]+$",
+            },
+            "count": {
+                "type": "int",
+                "required": True,
+                "min": 1,
+                "max": 5,
+            },
+            "threshold": {
+                "type": "float",
+                "required": True,
+                "min": 0.0,
+                "max": 1.0,
+            },
+            "flag": {
+                "type": "bool",
+                "required": True,
+            },
+            "genes": {
+                "type": "list",
+                "required": True,
+                "min_items": 1,
+                "max_items": 3,
+                "element_type": "string",
+            },
+            "floats": {
+                "type": "list",
+                "required": True,
+                "element_type": "float",
+                "min_items": 2,
+                "max_items": 4,
+            },
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def validator(schema):
+    # Compiled once and reused by every test, like a long-lived caller would.
+    return Validator(schema)
 
 
 # ---------------------------------------------------------------------------
 # Valid configuration
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
-def valid_config(tmp_path: Path):
-    fasta = tmp_path / "ref.fa"
-    fasta.write_text(">chr1\nACGT\n", encoding="utf-8")
+@pytest.fixture(scope="session")
+def _shared_paths(tmp_path_factory):
+    # Tests only replace config values, never touch these files, so they
+    # are created once per session and handed out as plain path strings.
+    root = tmp_path_factory.mktemp("shared")
+    fasta = root / "ref.fa"
+    fasta.write_bytes(_FASTA_BYTES)
 
-    outdir = tmp_path / "out"
+    outdir = root / "out"
     outdir.mkdir()
 
-    return {
-        "ref": str(fasta),
-        "outdir": str(outdir),
+    return os.fspath(fasta), os.fspath(outdir)
+
+
+@pytest.fixture(scope="session")
+def _valid_template(schema, _shared_paths):
+    fasta, outdir = _shared_paths
+    values = {
+        "ref": fasta,
+        "outdir": outdir,
         "metric": "a",
         "name": "Hello",
         "count": 3,
@@ -106,150 +122,151 @@ def valid_config(tmp_path: Path):
         "genes": ["A", "B"],
         "floats": [0.1, 0.9],
     }
+    # Insert keys in schema order: the validator walks the schema and looks
+    # each key up in the config, and issues for extra keys follow config
+    # order, so the two orders are kept coupled here rather than by hand.
+    return {key: values[key] for key in schema}
+
+
+@pytest.fixture
+def valid_config(_valid_template):
+    # Shallow copy: tests replace values but must not mutate nested lists.
+    return _valid_template.copy()
 
 
 # ---------------------------------------------------------------------------
 # Basic: valid config should yield zero issues
 # ---------------------------------------------------------------------------
 
-def test_valid_config(schema, valid_config):
-    issues = validate_config_against_schema(schema, valid_config)
-    assert issues == []
+def test_valid_config(schema, validator, valid_config):
+    assert validate_config_against_schema(schema, valid_config) == []
+    assert validator.validate(valid_config) == []
 
 
 # ---------------------------------------------------------------------------
 # Missing required fields
 # ---------------------------------------------------------------------------
 
-def test_missing_required(schema, valid_config):
+def test_missing_required(validator, valid_config, assert_issue):
     del valid_config["metric"]
-    issues = validate_config_against_schema(schema, valid_config)
+    issues = validator.validate(valid_config)
     assert len(issues) == 1
-    assert "Missing required field" in str(issues[0])
+    assert_issue(issues, "Missing required field")
 
 
 # ---------------------------------------------------------------------------
 # File tests
 # ---------------------------------------------------------------------------
 
-def test_file_missing(schema, valid_config):
-    valid_config["ref"] = "/path/does/not/exist.fa"
-    issues = validate_config_against_schema(schema, valid_config)
-    assert any("does not exist" in str(i) for i in issues)
-
-
-def test_file_empty(schema, valid_config, tmp_path):
+def test_file_empty(validator, valid_config, tmp_path, assert_issue):
     empty = tmp_path / "empty.fa"
-    empty.write_text("", encoding="utf-8")
+    empty.write_bytes(_EMPTY)
     valid_config["ref"] = str(empty)
-    issues = validate_config_against_schema(schema, valid_config)
-    assert any("empty" in str(i) for i in issues)
+    issues = validator.validate(valid_config)
+    assert_issue(issues, "empty")
 
 
-def test_file_bad_extension(schema, valid_config, tmp_path):
+def test_file_bad_extension(validator, valid_config, tmp_path, assert_issue):
     bad = tmp_path / "bad.txt"
-    bad.write_text("content", encoding="utf-8")
+    bad.write_bytes(_TXT)
     valid_config["ref"] = str(bad)
-    issues = validate_config_against_schema(schema, valid_config)
-    assert any("extension" in str(i) for i in issues)
+    issues = validator.validate(valid_config)
+    assert_issue(issues, "extension")
 
 
 # ---------------------------------------------------------------------------
 # Directory tests
 # ---------------------------------------------------------------------------
 
-def test_directory_missing(schema, valid_config, tmp_path):
+def test_directory_missing(validator, valid_config, tmp_path, assert_issue):
     valid_config["outdir"] = str(tmp_path / "does_not_exist")
-    issues = validate_config_against_schema(schema, valid_config)
-    assert any("does not exist" in str(i) for i in issues)
+    issues = validator.validate(valid_config)
+    assert_issue(issues, "does not exist")
 
 
 # ---------------------------------------------------------------------------
-# Enum test
+# Single-field rule violations
 # ---------------------------------------------------------------------------
 
-def test_enum_invalid(schema, valid_config):
-    valid_config["metric"] = "X"
-    issues = validate_config_against_schema(schema, valid_config)
-    assert any("allowed" in str(i) for i in issues)
+VIOLATIONS = [
+    pytest.param("ref", "/path/does/not/exist.fa", "does not exist", id="file-missing"),
+    pytest.param("metric", "X", "allowed", id="enum-invalid"),
+    pytest.param("name", "Hi", "minimum length", id="string-min-length"),
+    pytest.param("name", "TooLongName", "maximum length", id="string-max-length"),
+    pytest.param("name", "123", "regex", id="string-regex"),
+    pytest.param("count", 99, "greater than maximum", id="int-range"),
+    pytest.param("threshold", -0.1, "less than minimum", id="float-range"),
+    pytest.param("flag", "yes", "Expected bool", id="bool-invalid"),
+    pytest.param("genes", ["A", 123], "genes[1]", id="list-element-type"),
+    pytest.param("genes", [], "minimum", id="list-min-items"),
+]
+
+
+@pytest.mark.parametrize("key,value,needle", VIOLATIONS)
+def test_single_field_violation(validator, valid_config, key, value, needle, assert_issue):
+    valid_config[key] = value
+    issues = validator.validate(valid_config)
+    assert_issue(issues, needle)
+
+
+def test_all_violations(validator, valid_config):
+    # One config breaking every field at once; the validator aggregates
+    # issues, so this covers the first VIOLATIONS case per field in one run.
+    cases = {}
+    for case in VIOLATIONS:
+        key, value, needle = case.values
+        cases.setdefault(key, (value, needle))
+    valid_config.update({key: value for key, (value, _) in cases.items()})
+
+    messages = {}
+    for issue in validator.validate(valid_config):
+        messages.setdefault(issue.field.split("[")[0], []).append(str(issue))
+    assert messages.keys() == cases.keys()
+    for key, (_, needle) in cases.items():
+        assert any(needle in m for m in messages[key]), messages[key]
 
 
 # ---------------------------------------------------------------------------
-# String rules
+# Regex compilation is shared across calls
 # ---------------------------------------------------------------------------
 
-def test_string_min_length(schema, valid_config):
-    valid_config["name"] = "Hi"
-    issues = validate_config_against_schema(schema, valid_config)
-    assert any("minimum length" in str(i) for i in issues)
-
-
-def test_string_max_length(schema, valid_config):
-    valid_config["name"] = "TooLongName"
-    issues = validate_config_against_schema(schema, valid_config)
-    assert any("maximum length" in str(i) for i in issues)
-
-
-def test_string_regex(schema, valid_config):
-    valid_config["name"] = "123"
-    issues = validate_config_against_schema(schema, valid_config)
-    assert any("regex" in str(i) for i in issues)
+def test_regex_not_recompiled_per_call(schema, valid_config):
+    validate_config_against_schema(schema, valid_config)
+    misses = _compile_pattern.cache_info().misses
+    for _ in range(3):
+        validate_config_against_schema(schema, valid_config)
+    assert _compile_pattern.cache_info().misses == misses
 
 
 # ---------------------------------------------------------------------------
-# Int rules
+# Set/tuple rule values
 # ---------------------------------------------------------------------------
 
-def test_int_range(schema, valid_config):
-    valid_config["count"] = 99
-    issues = validate_config_against_schema(schema, valid_config)
-    assert any("greater than maximum" in str(i) for i in issues)
+def test_frozenset_and_tuple_rule_values(schema, valid_config, tmp_path, assert_issue):
+    # Rules written as Python literals may use sets/tuples; the validator
+    # normalizes them at compile time just like YAML lists.
+    literal_schema = dict(schema)
+    literal_schema["metric"] = {**schema["metric"], "allowed": frozenset({"a", "b", "c"})}
+    literal_schema["ref"] = {**schema["ref"], "extensions": (".fa",)}
+    validator = Validator(literal_schema)
+    assert validator.validate(valid_config) == []
 
-
-# ---------------------------------------------------------------------------
-# Float rules
-# ---------------------------------------------------------------------------
-
-def test_float_range(schema, valid_config):
-    valid_config["threshold"] = -0.1
-    issues = validate_config_against_schema(schema, valid_config)
-    assert any("less than minimum" in str(i) for i in issues)
-
-
-# ---------------------------------------------------------------------------
-# Boolean rule
-# ---------------------------------------------------------------------------
-
-def test_bool_invalid(schema, valid_config):
-    valid_config["flag"] = "yes"
-    issues = validate_config_against_schema(schema, valid_config)
-    assert any("Expected bool" in str(i) for i in issues)
-
-
-# ---------------------------------------------------------------------------
-# List item type validation
-# ---------------------------------------------------------------------------
-
-def test_list_element_type_invalid(schema, valid_config):
-    valid_config["genes"] = ["A", 123]
-    issues = validate_config_against_schema(schema, valid_config)
-    assert any("genes[1]" in str(i) for i in issues)
-
-
-def test_list_length_min(schema, valid_config):
-    valid_config["genes"] = []
-    issues = validate_config_against_schema(schema, valid_config)
-    assert any("minimum" in str(i) for i in issues)
+    bad = tmp_path / "bad.txt"
+    bad.write_bytes(_TXT)
+    valid_config.update(metric="X", ref=str(bad))
+    issues = validator.validate(valid_config)
+    assert_issue(issues, "allowed")
+    assert_issue(issues, "extension")
 
 
 # ---------------------------------------------------------------------------
 # Extra key detection
 # ---------------------------------------------------------------------------
 
-def test_extra_keys_disallowed(schema, valid_config):
+def test_extra_keys_disallowed(validator, valid_config, assert_issue):
     valid_config["extra"] = "value"
-    issues = validate_config_against_schema(schema, valid_config, allow_extra_keys=False)
-    assert any("Unexpected configuration key" in str(i) for i in issues)
+    issues = validator.validate(valid_config, allow_extra_keys=False)
+    assert_issue(issues, "Unexpected configuration key")
 
 
 # ---------------------------------------------------------------------------
@@ -260,3 +277,14 @@ def test_assert_valid_config_raises(schema, valid_config):
     valid_config["metric"] = "not_allowed"
     with pytest.raises(SchemaValidationError):
         assert_valid_config(schema, valid_config)
+
+
+def test_assert_valid_config_fail_fast(schema, valid_config):
+    valid_config.update(metric="not_allowed", count=99)
+    with pytest.raises(SchemaValidationError) as exc:
+        assert_valid_config(schema, valid_config, fail_fast=True)
+    assert [issue.field for issue in exc.value.issues] == ["metric"]
+
+    with pytest.raises(SchemaValidationError) as exc:
+        assert_valid_config(schema, valid_config)
+    assert [issue.field for issue in exc.value.issues] == ["metric", "count"]